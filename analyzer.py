@@ -10,12 +10,39 @@ Classes:
     Analyzer: A class containing methods for data analysis and result formatting.
 
 Dependencies:
+    numpy: For the histogram arrays of the fused statistics pass.
     pandas: For data manipulation and analysis.
+    numba: Optional; JIT-compiles the fused statistics pass when installed.
     typing: For type hinting.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+try:
+    import numba as nb
+except ImportError:
+    nb = None
+
+if nb is not None:
+    @nb.njit(cache=True)
+    def _top_codes(country_codes, city_codes, n_countries, n_cities):
+        """
+        Histogram both code arrays in one pass and return the argmax of each.
+
+        Codes of -1 (missing values in a categorical column) are skipped.
+        """
+        country_hist = np.zeros(n_countries, dtype=np.int64)
+        city_hist = np.zeros(n_cities, dtype=np.int64)
+        for i in range(country_codes.shape[0]):
+            c = country_codes[i]
+            if c >= 0:
+                country_hist[c] += 1
+            c = city_codes[i]
+            if c >= 0:
+                city_hist[c] += 1
+        return np.argmax(country_hist), np.argmax(city_hist)
 
 class Analyzer:
     """
@@ -25,14 +52,15 @@ class Analyzer:
     and format the results for presentation.
 
     Methods:
-        analyze_data(df: pd.DataFrame) -> Dict[str, Any]:
+        analyze_data(df: pd.DataFrame, country_counts: Optional[pd.Series] = None, city_counts: Optional[pd.Series] = None) -> Dict[str, Any]:
             Perform analysis on the given DataFrame and return the results.
         format_analysis(analysis: Dict[str, Any]) -> str:
             Format the analysis results into a human-readable string.
     """
 
     @staticmethod
-    def analyze_data(df: pd.DataFrame) -> Dict[str, Any]:
+    def analyze_data(df: pd.DataFrame, country_counts: Optional[pd.Series] = None,
+                     city_counts: Optional[pd.Series] = None) -> Dict[str, Any]:
         """
         Perform analysis on the given DataFrame.
 
@@ -41,6 +69,10 @@ class Analyzer:
 
         Args:
             df (pd.DataFrame): The DataFrame containing the Starbucks store data.
+            country_counts (Optional[pd.Series]): Precomputed store counts per country.
+                Computed from the DataFrame if not given.
+            city_counts (Optional[pd.Series]): Precomputed store counts per city.
+                Computed from the DataFrame if not given.
 
         Returns:
             Dict[str, Any]: A dictionary containing the analysis results.
@@ -50,11 +82,34 @@ class Analyzer:
                 - 'top_country': Country with the most stores
                 - 'top_city': City with the most stores
         """
+        top_country = country_counts.idxmax() if country_counts is not None else None
+        top_city = city_counts.idxmax() if city_counts is not None else None
+        if (top_country is None and top_city is None and nb is not None
+                and isinstance(df['Country'].dtype, pd.CategoricalDtype)
+                and isinstance(df['City'].dtype, pd.CategoricalDtype)):
+            # Fused single pass over the integer codes: both histograms are
+            # filled in one scan of the frame instead of two groupby passes.
+            country_cats = df['Country'].cat.categories
+            city_cats = df['City'].cat.categories
+            country_idx, city_idx = _top_codes(
+                df['Country'].cat.codes.to_numpy(), df['City'].cat.codes.to_numpy(),
+                len(country_cats), len(city_cats))
+            top_country = country_cats[country_idx]
+            top_city = city_cats[city_idx]
+        else:
+            if top_country is None:
+                top_country = df.groupby('Country', observed=True, sort=False).size().idxmax()
+            if top_city is None:
+                top_city = df.groupby('City', observed=True, sort=False).size().idxmax()
+        if isinstance(df['Country'].dtype, pd.CategoricalDtype):
+            total_countries = len(df['Country'].cat.categories)
+        else:
+            total_countries = df['Country'].unique().size
         return {
-            'total_stores': df['Store Number'].nunique(),
-            'total_countries': df['Country'].nunique(),
-            'top_country': df['Country'].value_counts().index[0],
-            'top_city': df['City'].value_counts().index[0]
+            'total_stores': df['Store Number'].unique().size,
+            'total_countries': total_countries,
+            'top_country': top_country,
+            'top_city': top_city
         }
 
     @staticmethod
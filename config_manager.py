@@ -30,7 +30,7 @@ class ConfigManager:
         __init__(self, config_file: str = 'config.json'): Initialize the ConfigManager with a specified config file.
         get(self, key: str) -> Any: Retrieve a configuration value by its key.
         set(self, key: str, value: Any) -> None: Set a configuration value for a given key.
-        save(self, config_file: str = 'config.json') -> None: Save the current configuration to a JSON file.
+        save(self, config_file: str = 'config.json') -> None: Save the configuration to a JSON file if it changed.
     """
 
     def __init__(self, config_file: str = 'config.json'):
@@ -42,6 +42,7 @@ class ConfigManager:
         """
         with open(config_file, 'r') as f:
             self.config: Dict[str, Any] = json.load(f)
+        self._dirty = False
 
     def get(self, key: str) -> Any:
         """
@@ -63,14 +64,22 @@ class ConfigManager:
             key (str): The key of the configuration setting to set.
             value (Any): The value to associate with the given key.
         """
-        self.config[key] = value
+        if self.config.get(key) != value:
+            self.config[key] = value
+            self._dirty = True
 
     def save(self, config_file: str = 'config.json') -> None:
         """
         Save the current configuration to a JSON file.
 
+        The file is only rewritten if a setting actually changed since the
+        configuration was loaded or last saved.
+
         Args:
             config_file (str): The path where the configuration file should be saved. Defaults to 'config.json'.
         """
+        if not self._dirty:
+            return
         with open(config_file, 'w') as f:
             json.dump(self.config, f, indent=4)
+        self._dirty = False
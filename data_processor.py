@@ -10,17 +10,23 @@ Classes:
     DataProcessor: Manages data processing operations on a pandas DataFrame.
 
 Functions:
-    fill_city: A helper function to fill missing city values with state/province values.
+    fill_city: A helper function to fill missing city values with state/province values (deprecated).
+    fill_city_vec: A vectorized variant of fill_city operating on whole columns.
 
 Dependencies:
+    numpy: For vectorized array operations.
     pandas: For data manipulation and analysis.
     typing: For type hinting.
     functools: For partial function application.
+    warnings: For the fill_city deprecation warning.
     config_manager: For managing configuration settings.
 """
 
+import warnings
+
+import numpy as np
 import pandas as pd
-from typing import Callable, Any
+from typing import Callable, Any, Dict, List, Optional
 from functools import partial
 from config_manager import ConfigManager
 
@@ -36,25 +42,64 @@ class DataProcessor:
         df (pd.DataFrame): The pandas DataFrame containing the data to be processed.
 
     Methods:
-        __init__(self, file_path: str): Initialize the DataProcessor with data from a CSV file.
+        __init__(self, file_path: str, config: Optional[ConfigManager] = None, usecols: Optional[List[str]] = None, dtypes: Optional[Dict[str, Any]] = None):
+            Initialize the DataProcessor with data from a CSV file.
         apply_function(self, func: Callable[[pd.Series], Any], column: str) -> None: Apply a function to a specific column.
+        fill_column_from(self, target: str, source: str) -> None: Fill missing values in one column from another column.
+        deduplicate(self, key: Optional[str] = None) -> int: Drop duplicate rows by key column, returning how many were removed.
         replace_values(self, column: str, value_map: dict) -> None: Replace values in a column based on a mapping.
+        unify_column(self, column: str, value: Any) -> None: Set every value in a column to a single constant.
+        index_by_country(self) -> None: Sort the DataFrame by Country and index it for fast country lookups.
         filter_by_country(self, country_code: str) -> pd.DataFrame: Filter the DataFrame by country code.
-        save_to_csv(self, file_path: str) -> None: Save the processed DataFrame to a CSV file.
+        save(self, file_path: str) -> None: Save the DataFrame in the format implied by the file suffix.
+        save_to_csv(self, file_path: str, engine: str = 'pyarrow') -> None: Save the processed DataFrame to a CSV file.
+        save_to_parquet(self, file_path: str) -> None: Save the processed DataFrame to a Parquet file.
         head(self) -> pd.DataFrame: Get the first few rows of the DataFrame.
-        missing_data(self) -> pd.Series: Get information about missing data in the DataFrame.
+        missing_data(self) -> pd.Series: Get information about missing data in the DataFrame (cached).
         city_null(self) -> pd.DataFrame: Get rows where the 'City' column is null.
     """
 
-    def __init__(self, file_path: str):
+    #: Default dtypes for the low-cardinality string columns. Storing them as
+    #: categories keeps the values as integer codes instead of Python strings.
+    DEFAULT_DTYPES = {
+        'Brand': 'category',
+        'Country': 'category',
+        'City': 'category',
+        'State/Province': 'category'
+    }
+
+    def __init__(self, file_path: str, config: Optional[ConfigManager] = None,
+                 usecols: Optional[List[str]] = None,
+                 dtypes: Optional[Dict[str, Any]] = None):
         """
         Initialize the DataProcessor with data from a CSV file.
 
+        Only the columns the program actually uses are parsed, and the
+        low-cardinality string columns are stored as categorical dtypes.
+
         Args:
             file_path (str): The path to the CSV file to be processed.
+            config (Optional[ConfigManager]): A shared ConfigManager instance.
+                A new one is created (re-reading config.json) if not given.
+            usecols (Optional[List[str]]): The columns to read from the CSV file.
+                Defaults to the 'usecols' list from the configuration file;
+                all columns are read if neither is set.
+            dtypes (Optional[Dict[str, Any]]): Column dtypes to pass to read_csv.
+                Defaults to DEFAULT_DTYPES.
         """
-        self.config = ConfigManager()
-        self.df = pd.read_csv(file_path)
+        self.config = config if config is not None else ConfigManager()
+        if usecols is None:
+            usecols = self.config.get('usecols')
+        if dtypes is None:
+            dtypes = self.DEFAULT_DTYPES
+        try:
+            # PyArrow tokenizes and parses the columns in parallel threads.
+            self.df = pd.read_csv(file_path, engine='pyarrow', usecols=usecols, dtype=dtypes)
+        except ImportError:
+            self.df = pd.read_csv(file_path, engine='c', memory_map=True, usecols=usecols, dtype=dtypes)
+        self._dirty = True
+        self._missing_cache = None
+        self._country_indexed = False
 
     def apply_function(self, func: Callable[[pd.Series], Any], column: str) -> None:
         """
@@ -65,41 +110,192 @@ class DataProcessor:
             column (str): The name of the column to apply the function to.
         """
         self.df[column] = self.df.apply(func, axis=1)
+        self._dirty = True
+
+    def fill_column_from(self, target: str, source: str) -> None:
+        """
+        Fill missing values in one column with values from another column.
+
+        This is a vectorized alternative to applying a row-wise function such as
+        fill_city, operating on whole columns instead of one row at a time.
+
+        Args:
+            target (str): The name of the column whose missing values should be filled.
+            source (str): The name of the column to take fill values from.
+        """
+        target_col = self.df[target]
+        source_col = self.df[source]
+        if isinstance(target_col.dtype, pd.CategoricalDtype):
+            if isinstance(source_col.dtype, pd.CategoricalDtype):
+                source_col = source_col.astype(object)
+            extra = pd.Index(source_col.dropna().unique()).difference(target_col.cat.categories)
+            if len(extra) > 0:
+                target_col = target_col.cat.add_categories(extra)
+        self.df[target] = target_col.fillna(source_col)
+        self._dirty = True
+
+    def deduplicate(self, key: Optional[str] = None) -> int:
+        """
+        Drop rows that duplicate an existing value in the key column.
+
+        The rest of the pipeline treats each row as one store, so duplicated
+        store numbers would be double-counted by every later aggregation.
+        Calling this more than once is a no-op.
+
+        Args:
+            key (Optional[str]): The column identifying a store. Defaults to
+                the 'dedup_key' configuration value, or 'Store Number'.
+
+        Returns:
+            int: The number of duplicate rows removed.
+        """
+        if key is None:
+            key = self.config.get('dedup_key') or 'Store Number'
+        before = len(self.df)
+        self.df = self.df.drop_duplicates(key, ignore_index=True)
+        self._dirty = True
+        return before - len(self.df)
 
     def replace_values(self, column: str, value_map: dict) -> None:
         """
         Replace values in a column based on a mapping.
 
+        Values not present in the mapping are kept as they are. Categorical
+        columns are remapped on their distinct categories rather than on every
+        row, and low-cardinality string columns are converted to categorical
+        first so they get the same treatment; other columns use Series.map,
+        which is faster than the general Series.replace machinery.
+
         Args:
             column (str): The name of the column to replace values in.
             value_map (dict): A dictionary mapping old values to new values.
         """
-        self.df[column] = self.df[column].replace(value_map)
+        col = self.df[column]
+        if value_map and len(set(value_map.values())) == 1:
+            # Broadcast a single constant, but only when the mapping covers
+            # every value actually present; a partial many-to-one map must
+            # leave unmapped values untouched.
+            if isinstance(col.dtype, pd.CategoricalDtype):
+                present = set(col.cat.categories)
+            else:
+                present = set(col.dropna().unique())
+            if present <= value_map.keys() and not col.hasnans:
+                self.unify_column(column, next(iter(value_map.values())))
+                return
+        if (not isinstance(col.dtype, pd.CategoricalDtype)
+                and pd.api.types.is_string_dtype(col)
+                and col.nunique() * 50 < len(col)):
+            col = col.astype('category')
+        if isinstance(col.dtype, pd.CategoricalDtype):
+            new_categories = [value_map.get(cat, cat) for cat in col.cat.categories]
+            if len(set(new_categories)) == len(new_categories):
+                self.df[column] = col.cat.rename_categories(new_categories)
+                self._dirty = True
+                return
+            # The mapping merges categories, which rename_categories rejects.
+            col = col.astype(object)
+        mapped = col.map(value_map)
+        self.df[column] = mapped.where(mapped.notna(), col)
+        self._dirty = True
+
+    def unify_column(self, column: str, value: Any) -> None:
+        """
+        Set every value in a column to a single constant.
+
+        A broadcast assignment replaces the per-value dictionary lookup that
+        replace_values would otherwise perform when all values map to the same
+        constant.
+
+        Args:
+            column (str): The name of the column to overwrite.
+            value (Any): The constant value to assign to every row.
+        """
+        self.df[column] = value
+        self._dirty = True
+
+    def index_by_country(self) -> None:
+        """
+        Sort the DataFrame by Country and index it for fast country lookups.
+
+        After this call, filter_by_country slices a sorted index instead of
+        scanning the whole frame with a boolean mask, which pays off when
+        several countries are filtered. The Country column is kept so
+        downstream code keeps working; the index is left unnamed to avoid
+        index/column ambiguity in groupbys. Note that this reorders the rows.
+        """
+        self.df = self.df.sort_values('Country').set_index('Country', drop=False)
+        self.df.index.name = None
+        self._country_indexed = True
 
     def filter_by_country(self, country_code: str) -> pd.DataFrame:
         """
         Filter the DataFrame by country code.
 
+        Uses a sorted-index slice when index_by_country has been called,
+        and a boolean mask over the Country column otherwise.
+
         Args:
             country_code (str): The country code to filter by.
 
         Returns:
             pd.DataFrame: A new DataFrame containing only rows for the specified country.
         """
+        if self._country_indexed:
+            if country_code in self.df.index:
+                return self.df.loc[[country_code]]
+            return self.df.iloc[0:0]
         return self.df[self.df['Country'] == country_code]
 
-    def save_to_csv(self, file_path: str) -> None:
+    def save(self, file_path: str) -> None:
+        """
+        Save the processed DataFrame in the format implied by the file suffix.
+
+        Paths ending in '.parquet' are written as Parquet; everything else is
+        written as CSV.
+
+        Args:
+            file_path (str): The path where the output file should be saved.
+        """
+        if file_path.endswith('.parquet'):
+            self.save_to_parquet(file_path)
+        else:
+            self.save_to_csv(file_path)
+
+    def save_to_csv(self, file_path: str, engine: str = 'pyarrow') -> None:
         """
         Save the processed DataFrame to a CSV file.
 
+        With the default 'pyarrow' engine the frame is serialized by PyArrow's
+        C++ CSV writer, which is considerably faster than pandas' row-by-row
+        writer. Falls back to pandas if PyArrow is not installed.
+
         Args:
             file_path (str): The path where the CSV file should be saved.
+            engine (str): 'pyarrow' (default) or 'pandas'.
+        """
+        if engine == 'pyarrow':
+            try:
+                import pyarrow as pa
+                from pyarrow import csv as pa_csv
+            except ImportError:
+                engine = 'pandas'
+            else:
+                pa_csv.write_csv(pa.Table.from_pandas(self.df, preserve_index=False), file_path)
+        if engine == 'pandas':
+            self.df.to_csv(file_path, index=False)
+
+    def save_to_parquet(self, file_path: str) -> None:
+        """
+        Save the processed DataFrame to a Parquet file.
+
+        Parquet output is both smaller and faster to write and read back than
+        CSV, so prefer it when the file is consumed by other programs.
+
+        Args:
+            file_path (str): The path where the Parquet file should be saved.
         """
-        self.df.to_csv(file_path, index=False)
-        self.config.set('output_file', file_path)
-        self.config.save()
+        self.df.to_parquet(file_path, index=False, compression='zstd')
 
-    @property
     def head(self) -> pd.DataFrame:
         """
         Get the first few rows of the DataFrame.
@@ -109,17 +305,22 @@ class DataProcessor:
         """
         return self.df.head()
 
-    @property
     def missing_data(self) -> pd.Series:
         """
         Get information about missing data in the DataFrame.
 
+        The result is cached and only recomputed after a method has mutated
+        the DataFrame, so repeated calls do not rescan the frame.
+
         Returns:
             pd.Series: A series containing the count of missing values for each column with missing data.
         """
-        return self.df.isnull().sum()[lambda x: x > 0]
+        if self._missing_cache is None or self._dirty:
+            counts = pd.Series(self.df.isna().to_numpy().sum(axis=0), index=self.df.columns)
+            self._missing_cache = counts[counts > 0]
+            self._dirty = False
+        return self._missing_cache
 
-    @property
     def city_null(self) -> pd.DataFrame:
         """
         Get rows where the 'City' column is null.
@@ -133,10 +334,37 @@ def fill_city(row: pd.Series) -> str:
     """
     Fill missing city values with state/province values.
 
+    Deprecated: this runs once per row via DataFrame.apply(axis=1); use
+    fill_city_vec or DataProcessor.fill_column_from instead, which do the
+    same work in a single column-level operation.
+
     Args:
         row (pd.Series): A row from the DataFrame.
 
     Returns:
         str: The city value if not null, otherwise the state/province value.
     """
+    warnings.warn("fill_city is deprecated; use fill_city_vec or "
+                  "DataProcessor.fill_column_from instead", DeprecationWarning,
+                  stacklevel=2)
     return row['State/Province'] if pd.isnull(row['City']) else row['City']
+
+def fill_city_vec(df: pd.DataFrame) -> np.ndarray:
+    """
+    Fill missing city values with state/province values, vectorized.
+
+    Operates on the underlying arrays in one masked assignment instead of
+    calling a Python function per row.
+
+    Args:
+        df (pd.DataFrame): The DataFrame with 'City' and 'State/Province' columns.
+
+    Returns:
+        np.ndarray: The city values with missing entries filled from 'State/Province'.
+    """
+    city = df['City'].to_numpy()
+    sp = df['State/Province'].to_numpy()
+    mask = pd.isna(city)
+    out = city.copy()
+    out[mask] = sp[mask]
+    return out
@@ -19,11 +19,30 @@ Dependencies:
 - config_manager: For managing configuration information
 """
 
-from data_processor import DataProcessor, fill_city
-from visualizer import Visualizer
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+from data_processor import DataProcessor
+from visualizer import Visualizer, render_plot
 from analyzer import Analyzer
 from config_manager import ConfigManager
 
+def parse_args():
+    """
+    Parse command-line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments, with a no_plots flag that
+        skips all chart generation (matplotlib/seaborn are then never imported).
+    """
+    parser = argparse.ArgumentParser(description='星巴克全球店铺数据分析')
+    parser.add_argument('--no-plots', action='store_true', help='跳过图表生成')
+    parser.add_argument('--show', action='store_true', help='交互式显示图表，而不是保存为图片')
+    return parser.parse_args()
+
 def main():
     """
     Main function that coordinates the execution flow of the entire program.
@@ -41,46 +60,85 @@ def main():
     No parameters, no return value
     """
 
+    args = parse_args()
+
+    # Bound any accidental full-frame repr: formatting a DataFrame walks
+    # every cell in Python, so never print more than 20 rows.
+    pd.options.display.max_rows = 20
+
     config = ConfigManager()
 
-    processor = DataProcessor(config.get('input_file'))
+    processor = DataProcessor(config.get('input_file'), config)
+
+    removed = processor.deduplicate()
+    if removed:
+        print(f"已去除 {removed} 条重复的店铺记录")
+
     print("前五行数据：")
-    print(processor.head)
+    print(processor.head())
 
     print("\n缺失值情况：")
-    print(processor.missing_data)
+    print(processor.missing_data())
 
     print("\nCity字段缺失的数据：")
-    print(processor.city_null)
+    print(processor.city_null())
 
-    processor.apply_function(fill_city, 'City')
+    processor.fill_column_from('City', 'State/Province')
+    processor.index_by_country()
 
     print("\n填充后的埃及(EG)数据：")
-    print(processor.filter_by_country('EG'))
+    print(processor.filter_by_country('EG').head(20))
 
-    unique_brands = processor.df['Brand'].unique()
-    print("\n唯一的Brand值：", unique_brands)
+    print("\n唯一的Brand值：", processor.df['Brand'].cat.categories.to_list())
 
-    processor.replace_values('Brand', dict.fromkeys(unique_brands, 'Starbucks'))
+    processor.unify_column('Brand', 'Starbucks')
+
+    cn_starbucks = processor.filter_by_country('CN')
 
-    processor.save_to_csv(config.get('output_file'))
+    # The two writes are independent and I/O-bound, and pandas/pyarrow
+    # release the GIL while writing, so overlap them on two threads.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        full_write = executor.submit(processor.save, config.get('output_file'))
+        cn_write = executor.submit(cn_starbucks.to_csv, config.get('cn_output_file'), index=False)
+        full_write.result()
+        cn_write.result()
     print(f"\n数据已保存到{config.get('output_file')}")
+    print(f"中国星巴克数据已保存到{config.get('cn_output_file')}")
 
-    Visualizer.plot_top_countries(processor.df)
-    Visualizer.plot_top_cities(processor.df)
+    country_city_counts = processor.df.groupby(['Country', 'City'], observed=True, sort=False).size()
+    country_counts = country_city_counts.groupby(level='Country', observed=True, sort=False).sum()
+    city_counts = country_city_counts.groupby(level='City', observed=True, sort=False).sum()
 
-    cn_starbucks = processor.filter_by_country('CN')
     print("\n中国星巴克分布（前五行）：")
     print(cn_starbucks.head())
 
-    cn_starbucks.to_csv(config.get('cn_output_file'), index=False)
-    print(f"\n中国星巴克数据已保存到{config.get('cn_output_file')}")
-
-    Visualizer.plot_top_cn_cities(cn_starbucks)
+    if not args.no_plots:
+        cn_city_counts = country_city_counts.loc['CN']
+        plots = [
+            (country_counts.nlargest(10), 10, '店铺数量排名前10的国家', '国家', '店铺数量', False, 'top_countries.png'),
+            (city_counts.nlargest(10), 10, '店铺数量排名前10的城市', '城市', '店铺数量', False, 'top_cities.png'),
+            (cn_city_counts.nlargest(10), 10, '中国星巴克店铺数量前10的城市', '店铺数量', '城市', True, 'top_cn_cities.png')
+        ]
+        if args.show:
+            for counts, n, title, xlabel, ylabel, horizontal, _ in plots:
+                Visualizer.plot_top_n(counts, n, title, xlabel, ylabel, horizontal)
+        else:
+            plot_dir = config.get('plot_dir') or '.'
+            with ProcessPoolExecutor(max_workers=len(plots)) as executor:
+                futures = [
+                    executor.submit(render_plot, counts, n, title, xlabel, ylabel,
+                                    horizontal, os.path.join(plot_dir, filename))
+                    for counts, n, title, xlabel, ylabel, horizontal, filename in plots
+                ]
+                for future in futures:
+                    future.result()
+            print(f"\n图表已保存到{plot_dir}")
 
     analyzer = Analyzer()
-    analysis = analyzer.analyze_data(processor.df)
+    analysis = analyzer.analyze_data(processor.df, country_counts=country_counts, city_counts=city_counts)
     print(analyzer.format_analysis(analysis))
 
+    config.save()
+
 if __name__ == "__main__":
     main()
@@ -9,20 +9,62 @@ including bar plots for top countries, cities, and Chinese cities with the most
 Classes:
     Visualizer: A class containing static methods for data visualization.
 
+Functions:
+    render_plot: Draw one bar plot and save it to a file, suitable for worker processes.
+
 Dependencies:
-    matplotlib.pyplot: For creating plots.
-    seaborn: For enhanced plot styling.
+    matplotlib.pyplot: For creating plots (imported lazily on first plot).
+    seaborn: For enhanced plot styling (imported lazily on first plot).
     typing: For type hinting.
     pandas: For data manipulation and analysis.
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import pandas as pd
 
-plt.rcParams['font.sans-serif'] = ['SimHei']
-plt.rcParams['axes.unicode_minus'] = False
+plt = None
+sns = None
+
+def _ensure_mpl() -> None:
+    """
+    Import matplotlib and seaborn on first use.
+
+    Importing these libraries takes hundreds of milliseconds and tens of MB
+    of memory, so the cost is only paid when a plot is actually drawn. The
+    modules are stashed in the plt/sns module globals and the font settings
+    for Chinese labels are applied once.
+    """
+    global plt, sns
+    if plt is not None:
+        return
+    import matplotlib.pyplot
+    import seaborn
+    plt = matplotlib.pyplot
+    sns = seaborn
+    plt.rcParams['font.sans-serif'] = ['SimHei']
+    plt.rcParams['axes.unicode_minus'] = False
+
+def render_plot(data: pd.Series, n: int, title: str, xlabel: str, ylabel: str,
+                horizontal: bool, out_path: str) -> None:
+    """
+    Draw one bar plot and save it to a file.
+
+    A module-level function so it can be pickled and run in a worker process;
+    the non-interactive Agg backend is forced before matplotlib is imported,
+    which also keeps each worker's matplotlib state isolated.
+
+    Args:
+        data (pd.Series): The data series to plot.
+        n (int): The number of top items to include in the plot.
+        title (str): The title of the plot.
+        xlabel (str): The label for the x-axis.
+        ylabel (str): The label for the y-axis.
+        horizontal (bool): Whether to create a horizontal bar plot.
+        out_path (str): The path to save the figure to.
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    Visualizer.plot_top_n(data, n, title, xlabel, ylabel, horizontal, out_path=out_path)
 
 class Visualizer:
     """
@@ -43,7 +85,8 @@ class Visualizer:
     """
 
     @staticmethod
-    def plot_top_n(data: pd.Series, n: int, title: str, xlabel: str, ylabel: str, horizontal: bool = False) -> None:
+    def plot_top_n(data: pd.Series, n: int, title: str, xlabel: str, ylabel: str,
+                   horizontal: bool = False, out_path: Optional[str] = None) -> None:
         """
         Create a bar plot of the top n items in a series.
 
@@ -54,7 +97,10 @@ class Visualizer:
             xlabel (str): The label for the x-axis.
             ylabel (str): The label for the y-axis.
             horizontal (bool, optional): Whether to create a horizontal bar plot. Defaults to False.
+            out_path (Optional[str]): If given, save the figure to this path instead
+                of showing it interactively.
         """
+        _ensure_mpl()
         plt.figure(figsize=(12, 6))
         if horizontal:
             sns.barplot(y=data.index[:n], x=data.values[:n])
@@ -64,7 +110,11 @@ class Visualizer:
         plt.xlabel(xlabel)
         plt.ylabel(ylabel)
         plt.xticks(rotation=45 if not horizontal else 0)
-        plt.show()
+        if out_path is not None:
+            plt.savefig(out_path, bbox_inches='tight')
+            plt.close()
+        else:
+            plt.show()
 
     @classmethod
     def plot_top_countries(cls, df: pd.DataFrame, n: int = 10) -> None:
@@ -75,7 +125,7 @@ class Visualizer:
             df (pd.DataFrame): The DataFrame containing the Starbucks store data.
             n (int, optional): The number of top countries to include. Defaults to 10.
         """
-        top_countries = df['Country'].value_counts().nlargest(n)
+        top_countries = df.groupby('Country', observed=True, sort=False).size().nlargest(n)
         cls.plot_top_n(top_countries, n, f'店铺数量排名前{n}的国家', '国家', '店铺数量')
 
     @classmethod
@@ -87,7 +137,7 @@ class Visualizer:
             df (pd.DataFrame): The DataFrame containing the Starbucks store data.
             n (int, optional): The number of top cities to include. Defaults to 10.
         """
-        top_cities = df['City'].value_counts().nlargest(n)
+        top_cities = df.groupby('City', observed=True, sort=False).size().nlargest(n)
         cls.plot_top_n(top_cities, n, f'店铺数量排名前{n}的城市', '城市', '店铺数量')
 
     @classmethod
@@ -99,5 +149,5 @@ class Visualizer:
             df (pd.DataFrame): The DataFrame containing the Starbucks store data for China.
             n (int, optional): The number of top cities to include. Defaults to 10.
         """
-        top_cn_cities = df['City'].value_counts().nlargest(n)
+        top_cn_cities = df.groupby('City', observed=True, sort=False).size().nlargest(n)
         cls.plot_top_n(top_cn_cities, n, f'中国星巴克店铺数量前{n}的城市', '店铺数量', '城市', horizontal=True)